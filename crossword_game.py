@@ -24,24 +24,57 @@ It will load the word database, generate a crossword and output the grid
 and clues.
 """
 
+import io
 import json
 import random
 import os
+import re
+import sys
+from collections import defaultdict
 from typing import List, Tuple, Dict, Optional
 
+# orjson parses large databases considerably faster, but it is optional: the
+# standard library parser is used when it is not installed.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+
+# Maps each letter code to the cells holding it that a new word could still
+# cross, as {(row, col): direction} where direction is that of the word owning
+# the cell.  Cells where two words already cross are dropped from the index.
+LetterIndex = Dict[int, Dict[Tuple[int, int], int]]
+
+# Value of an empty cell in the flat grid; filled cells hold the ASCII code of
+# their (uppercase) letter.
+EMPTY = 0
+
+# Words must consist of ASCII letters only so they fit in the byte grid.
+WORD_PATTERN = re.compile(r'[A-Za-z]+')
+
 
 class WordEntry:
     """Represents a single word and its clue."""
     def __init__(self, word: str, clue: str):
         self.word = word.upper()
         self.clue = clue
+        # The word as ASCII bytes, as stored on the grid
+        self.word_bytes = self.word.encode('ascii')
+        # Offsets within the word at which each letter code occurs
+        self.positions: Dict[int, List[int]] = defaultdict(list)
+        for i, ch in enumerate(self.word_bytes):
+            self.positions[ch].append(i)
 
 
 class PlacedWord:
     """Represents a word placed on the crossword grid."""
+    __slots__ = ('entry', 'clue', 'row', 'col', 'direction')
+
     def __init__(self, entry: WordEntry, row: int, col: int, direction: int):
         # direction: 0 = horizontal, 1 = vertical
         self.entry = entry
+        self.clue = entry.clue
         self.row = row
         self.col = col
         self.direction = direction
@@ -50,144 +83,173 @@ class PlacedWord:
 
 def load_database(filepath: str) -> List[WordEntry]:
     """Load the word database from a JSON file and return a list of WordEntry objects."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(filepath, 'rb') as f:
+        data = json_loads(f.read())
     entries = []
+    skipped = []
     for item in data:
-        word = item.get('word', '').strip().lower()
+        word = item.get('word', '').strip()
         clue = item.get('clue', '').strip()
         # Skip entries with invalid words
-        if word and word.isalpha():
+        if WORD_PATTERN.fullmatch(word):
             entries.append(WordEntry(word, clue))
+        else:
+            skipped.append(word)
+    if skipped:
+        print(f"Skipped {len(skipped)} database entries whose words are not made of ASCII letters A-Z: "
+              + ', '.join(repr(w) for w in skipped), file=sys.stderr)
     return entries
 
 
 
 def select_words(entries: List[WordEntry], max_words: int = 10) -> List[WordEntry]:
-    """Randomly select up to max_words entries from the database."""
-    # Shuffle the entries and return the first max_words
-    random.shuffle(entries)
-    return entries[:max_words]
+    """Randomly select up to max_words entries from the database without modifying it."""
+    return random.sample(entries, max(0, min(max_words, len(entries))))
 
 
 
-def initialise_grid(size: int) -> List[List[Optional[str]]]:
-    """Create an empty crossword grid of the given size."""
-    return [[None for _ in range(size)] for _ in range(size)]
+def initialise_grid(size: int) -> bytearray:
+    """
+    Create an empty crossword grid of the given size.
+
+    The grid is stored row by row in a flat bytearray, so the cell at (r, c)
+    lives at index r * size + c and empty cells hold EMPTY.
+    """
+    return bytearray(size * size)
 
 
 
-def can_place(word: str, row: int, col: int, direction: int, grid: List[List[Optional[str]]]) -> bool:
+def try_place(word: bytes, row: int, col: int, direction: int, grid: bytearray, size: int,
+              letter_positions: LetterIndex) -> bool:
     """
-    Check whether a word can be placed at the given position and direction on the grid.
+    Place a word at the given position and direction if it fits on the grid.
+
+    The word is checked and written in a single pass over its cells.  Letters
+    are written as soon as their cell has been validated; if a later cell
+    turns out to conflict, the cells written so far are cleared again and
+    the grid is left unchanged.
 
     Args:
-        word: The word to place (uppercase).
+        word: The word to place, as uppercase ASCII bytes.
         row: The starting row index.
         col: The starting column index.
         direction: 0 for horizontal, 1 for vertical.
         grid: The crossword grid.
+        size: The size of the square grid.
+        letter_positions: Index of the crossable letters on the grid, updated
+            when the word is placed.
 
     Returns:
-        True if placement is possible, otherwise False.
+        True if the word was placed, otherwise False.
     """
-    size = len(grid)
-    for i, ch in enumerate(word):
-        r = row + (direction == 1) * i
-        c = col + (direction == 0) * i
-        # Check bounds
-        if r < 0 or r >= size or c < 0 or c >= size:
-            return False
-        # Check conflict with existing letters
-        existing = grid[r][c]
-        if existing is not None and existing != ch:
-            return False
-        # Check adjacency (simple version): make sure that adjacent cells
-        # perpendicular to the direction of the word do not form illegal words
-        if existing is None:
-            # Check above and below for horizontal word or left and right for vertical
-            if direction == 0:  # horizontal
-                # Check above
-                if r > 0 and grid[r - 1][c] is not None:
-                    return False
-                # Check below
-                if r < size - 1 and grid[r + 1][c] is not None:
-                    return False
-            else:  # vertical
-                # Check left
-                if c > 0 and grid[r][c - 1] is not None:
-                    return False
-                # Check right
-                if c < size - 1 and grid[r][c + 1] is not None:
-                    return False
+    n = len(word)
+    # Row and column steps along the word, computed once rather than per cell
+    dr, dc = (0, 1) if direction == 0 else (1, 0)
+    # Check bounds once for the whole word: it fits if its first and last cells do
+    if row < 0 or col < 0 or row + dr * (n - 1) >= size or col + dc * (n - 1) >= size:
+        return False
     # Check boundaries at ends of the word (prevent immediate adjacency to another word)
     if direction == 0:  # horizontal
         # cell before the start
-        if col > 0 and grid[row][col - 1] is not None:
+        if col > 0 and grid[row * size + col - 1] != EMPTY:
             return False
         # cell after the end
-        end_c = col + len(word)
-        if end_c < size and grid[row][end_c] is not None:
+        end_c = col + n
+        if end_c < size and grid[row * size + end_c] != EMPTY:
             return False
     else:  # vertical
         # cell above the start
-        if row > 0 and grid[row - 1][col] is not None:
+        if row > 0 and grid[(row - 1) * size + col] != EMPTY:
             return False
         # cell below the end
-        end_r = row + len(word)
-        if end_r < size and grid[end_r][col] is not None:
+        end_r = row + n
+        if end_r < size and grid[end_r * size + col] != EMPTY:
             return False
+    # Everything below depends only on the word's line, not on the cell, so it
+    # is worked out once: the index step between cells, the offset to the
+    # neighbours either side of the word, and whether those lie on the grid
+    step = dr * size + dc
+    side = size if direction == 0 else 1
+    line = row if direction == 0 else col
+    check_before = line > 0
+    check_after = line < size - 1
+    # Indices of the cells written by this word, cleared again on failure
+    writes: List[int] = []
+    # Indices of the existing letters this word crosses
+    crossings: List[int] = []
+    fits = True
+    idx = row * size + col
+    for ch in word:
+        existing = grid[idx]
+        if existing != EMPTY:
+            # Check conflict with existing letters
+            if existing != ch:
+                fits = False
+                break
+            crossings.append(idx)
+        else:
+            # Check adjacency (simple version): make sure that adjacent cells
+            # perpendicular to the direction of the word (above and below for
+            # horizontal, left and right for vertical) do not form illegal words
+            if (check_before and grid[idx - side] != EMPTY) or (check_after and grid[idx + side] != EMPTY):
+                fits = False
+                break
+            grid[idx] = ch
+            writes.append(idx)
+        idx += step
+    if not fits:
+        # Roll back the letters written before the conflict
+        for idx in writes:
+            grid[idx] = EMPTY
+        return False
+    # The new letters can be crossed by later words; the crossed ones no longer can
+    for idx in writes:
+        letter_positions[grid[idx]][divmod(idx, size)] = direction
+    for idx in crossings:
+        # The cell may already have been dropped by an earlier crossing
+        letter_positions[grid[idx]].pop(divmod(idx, size), None)
     return True
 
 
 
-def place_word(word: str, row: int, col: int, direction: int, grid: List[List[Optional[str]]]):
-    """Place a word on the grid at the specified position and direction."""
-    for i, ch in enumerate(word):
-        r = row + (direction == 1) * i
-        c = col + (direction == 0) * i
-        grid[r][c] = ch
-
-
-
-def try_place_word(entry: WordEntry, placed: List[PlacedWord], grid: List[List[Optional[str]]]) -> Optional[PlacedWord]:
+def try_place_word(entry: WordEntry, grid: bytearray, size: int, letter_positions: LetterIndex) -> Optional[PlacedWord]:
     """
     Try to place a new word on the grid by crossing it with existing words.
 
     Args:
         entry: The WordEntry to place.
-        placed: A list of already placed words on the grid.
         grid: The current grid.
+        size: The size of the square grid.
+        letter_positions: Index of the crossable letters on the grid.
 
     Returns:
         A PlacedWord instance if the word was placed, otherwise None.
     """
-    word = entry.word
-    # For each letter in the new word, try to cross with existing words
-    for placed_word in placed:
-        pw = placed_word.entry.word
-        for i, pw_ch in enumerate(pw):
-            for j, ch in enumerate(word):
-                if pw_ch != ch:
-                    continue
-                # Determine placement position depending on placed word direction
-                if placed_word.direction == 0:  # existing word is horizontal, so new word should be vertical
-                    row = placed_word.row - j
-                    col = placed_word.col + i
-                    direction = 1
+    word = entry.word_bytes
+    # For each distinct letter in the new word, look up the cells holding that letter
+    for ch, offsets in entry.positions.items():
+        cells = letter_positions.get(ch)
+        if not cells:
+            continue
+        for (r, c), d in cells.items():
+            # The new word runs perpendicular to the word owning the cell
+            direction = 1 - d
+            # Try each occurrence of the letter in the new word at this cell
+            for j in offsets:
+                if direction == 1:  # existing word is horizontal, so new word is vertical
+                    row = r - j
+                    col = c
                 else:  # existing word is vertical, new word will be horizontal
-                    row = placed_word.row + i
-                    col = placed_word.col - j
-                    direction = 0
-                # Check placement
-                if can_place(word, row, col, direction, grid):
-                    place_word(word, row, col, direction, grid)
+                    row = r
+                    col = c - j
+                # Check placement and place the word if it fits
+                if try_place(word, row, col, direction, grid, size, letter_positions):
                     return PlacedWord(entry, row, col, direction)
     return None
 
 
 
-def generate_crossword(entries: List[WordEntry], size: int = 13, max_words: int = 10) -> Tuple[List[List[Optional[str]]], List[PlacedWord]]:
+def generate_crossword(entries: List[WordEntry], size: int = 13, max_words: int = 10) -> Tuple[bytearray, List[PlacedWord]]:
     """
     Generate a crossword grid and return the grid along with the list of placed words.
 
@@ -205,20 +267,22 @@ def generate_crossword(entries: List[WordEntry], size: int = 13, max_words: int
     selected.sort(key=lambda e: len(e.word), reverse=True)
 
     grid = initialise_grid(size)
+    letter_positions: LetterIndex = defaultdict(dict)
     placed_words: List[PlacedWord] = []
 
+    # Walk the words longest first; the first one anchors the grid
+    ordered = iter(selected)
+    first = next(ordered, None)
     # Place the first word horizontally in the middle row
-    if selected:
-        first = selected.pop(0)
-        word_len = len(first.word)
+    if first is not None:
+        word = first.word_bytes
         row = size // 2
-        col = max(0, (size - word_len) // 2)
-        if can_place(first.word, row, col, 0, grid):
-            place_word(first.word, row, col, 0, grid)
+        col = max(0, (size - len(word)) // 2)
+        if try_place(word, row, col, 0, grid, size, letter_positions):
             placed_words.append(PlacedWord(first, row, col, 0))
     # Try to place the remaining words
-    for entry in selected:
-        pw = try_place_word(entry, placed_words, grid)
+    for entry in ordered:
+        pw = try_place_word(entry, grid, size, letter_positions)
         if pw:
             placed_words.append(pw)
         # If not placed, skip
@@ -226,12 +290,11 @@ def generate_crossword(entries: List[WordEntry], size: int = 13, max_words: int
 
 
 
-def number_grid(grid: List[List[Optional[str]]], placed_words: List[PlacedWord]) -> Tuple[Dict[int, Tuple[int, int]], Dict[int, str], Dict[int, str]]:
+def number_grid(placed_words: List[PlacedWord]) -> Tuple[Dict[int, Tuple[int, int]], Dict[int, str], Dict[int, str]]:
     """
     Assign numbers to starting positions of across and down answers.
 
     Args:
-        grid: The crossword grid.
         placed_words: List of placed words on the grid.
 
     Returns:
@@ -240,83 +303,59 @@ def number_grid(grid: List[List[Optional[str]]], placed_words: List[PlacedWord])
             across: mapping from number to clue for across words.
             down: mapping from number to clue for down words.
     """
-    size = len(grid)
     numbers: Dict[int, Tuple[int, int]] = {}
     across: Dict[int, str] = {}
     down: Dict[int, str] = {}
-    num = 1
-    # Create a quick lookup from coordinates to PlacedWord
-    placed_lookup: Dict[Tuple[int, int], List[PlacedWord]] = {}
+    # Group the placed words by the cell they start from
+    starts: Dict[Tuple[int, int], List[PlacedWord]] = defaultdict(list)
     for pw in placed_words:
-        word = pw.entry.word
-        for i in range(len(word)):
-            r = pw.row + (pw.direction == 1) * i
-            c = pw.col + (pw.direction == 0) * i
-            placed_lookup.setdefault((r, c), []).append(pw)
-    # Determine starting positions
-    for r in range(size):
-        for c in range(size):
-            ch = grid[r][c]
-            if ch is None:
-                continue
-            # Check if this is the start of an across word
-            start_across = False
-            start_down = False
-            # Across: if at left edge or cell to left is empty, and cell to right is letter
-            if c == 0 or grid[r][c - 1] is None:
-                # ensure there is at least one more letter to the right to make a word (length>1)
-                if c + 1 < size and grid[r][c + 1] is not None:
-                    start_across = True
-            # Down: if at top edge or cell above is empty, and cell below is letter
-            if r == 0 or grid[r - 1][c] is None:
-                if r + 1 < size and grid[r + 1][c] is not None:
-                    start_down = True
-            if start_across or start_down:
-                numbers[num] = (r, c)
-                # Determine which placed word corresponds to this start cell and direction
-                if start_across:
-                    # Find the placed word that is horizontal and has this start
-                    for pw in placed_words:
-                        if pw.direction == 0 and pw.row == r and pw.col == c:
-                            across[num] = pw.entry.clue
-                            break
-                if start_down:
-                    for pw in placed_words:
-                        if pw.direction == 1 and pw.row == r and pw.col == c:
-                            down[num] = pw.entry.clue
-                            break
-                num += 1
+        # Only answers of two or more letters are numbered; a one-letter word
+        # lies inside a longer perpendicular word and is not an answer itself
+        if len(pw.entry.word_bytes) < 2:
+            continue
+        starts[(pw.row, pw.col)].append(pw)
+    # Number the starting cells in reading order (top to bottom, left to right)
+    for num, pos in enumerate(sorted(starts), 1):
+        numbers[num] = pos
+        for pw in starts[pos]:
+            if pw.direction == 0:
+                across[num] = pw.clue
+            else:
+                down[num] = pw.clue
     return numbers, across, down
 
 
 
-def print_crossword(grid: List[List[Optional[str]]], numbers: Dict[int, Tuple[int, int]], across: Dict[int, str], down: Dict[int, str]):
+def print_crossword(grid: bytearray, size: int, numbers: Dict[int, Tuple[int, int]], across: Dict[int, str], down: Dict[int, str]):
     """Print the crossword grid and the lists of across and down clues."""
-    size = len(grid)
     # Create a reverse lookup for numbers
     number_lookup: Dict[Tuple[int, int], int] = {pos: n for n, pos in numbers.items()}
-    print("\nCrossword Grid:\n")
+    # Build the whole output in memory and write it to stdout in one go
+    buf = io.StringIO()
+    buf.write("\nCrossword Grid:\n\n")
     for r in range(size):
-        row_str = ''
         for c in range(size):
-            ch = grid[r][c]
-            if ch is None:
-                row_str += ' . '
+            ch = grid[r * size + c]
+            if ch == EMPTY:
+                buf.write(' . ')
             else:
                 # If this cell has a number, prefix with number inside brackets
                 num = number_lookup.get((r, c))
                 if num is not None:
                     # Print number padded to 2 digits for alignment
-                    row_str += f"[{num:2}]"
+                    buf.write(f"[{num:2}]")
                 else:
-                    row_str += f" {ch} "
-        print(row_str)
-    print("\nAcross:")
-    for num in sorted(across.keys()):
-        print(f"{num}. {across[num]}")
-    print("\nDown:")
-    for num in sorted(down.keys()):
-        print(f"{num}. {down[num]}")
+                    buf.write(f" {chr(ch)} ")
+        buf.write('\n')
+    buf.write("\nAcross:\n")
+    # number_grid assigns numbers in increasing order, so the clues are
+    # already in order
+    for num, clue in across.items():
+        buf.write(f"{num}. {clue}\n")
+    buf.write("\nDown:\n")
+    for num, clue in down.items():
+        buf.write(f"{num}. {clue}\n")
+    sys.stdout.write(buf.getvalue())
 
 
 
@@ -331,11 +370,12 @@ def main():
         print("No valid words found in the database.  Please populate database.json.")
         return
     # Generate the crossword
-    grid, placed_words = generate_crossword(entries, size=13, max_words=13)
+    size = 13
+    grid, placed_words = generate_crossword(entries, size=size, max_words=13)
     # Number the grid and get clues
-    numbers, across, down = number_grid(grid, placed_words)
+    numbers, across, down = number_grid(placed_words)
     # Print the result
-    print_crossword(grid, numbers, across, down)
+    print_crossword(grid, size, numbers, across, down)
 
 
 if __name__ == '__main__':